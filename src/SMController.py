@@ -81,6 +81,8 @@ class SMController:
             ** 2
         )
         self.goal_grid /= self.goal_grid.sum(axis=1)
+        self.comp_grid_cache = None
+        self.comp_grid_version = None
         self.getCompetenceGrid()
 
         # This effectively ensures that first 10% of simulation steps
@@ -138,13 +140,15 @@ class SMController:
         #policies = (policies + self.policy_noise) # TEST: no competence exploration
         return policies, comp, rcomp
 
-    def computeMatchSimple(self, v_p, ss_p, p_p, a_p, g_p):
-        mods = np.stack([v_p, ss_p, p_p, a_p])
+    def computeMatchStacked(self, mods, g_p):
         diffs = np.moveaxis(np.linalg.norm(mods - g_p, axis=-1), 0, -1)
         match_per_mod = np.exp(-0.5 * (self.match_sigma**-2) * (diffs**2))
         match = np.average(match_per_mod, axis=-1, weights=params.modalities_weights)
         return match, match_per_mod
 
+    def computeMatchSimple(self, v_p, ss_p, p_p, a_p, g_p):
+        return self.computeMatchStacked(np.stack([v_p, ss_p, p_p, a_p]), g_p)
+
     # TODO: This method is outdated and is kept for reference
     def computeMatch(self, representations, target):
         repall = np.stack(representations)
@@ -196,9 +200,13 @@ class SMController:
         return matches, matches_increments.ravel(), matches_per_mod, matches_increments_per_mod
 
     def getCompetenceGrid(self):
-        comp = self.predict.spread(self.goal_grid)
-        return comp
-        #return SMController.comp_fun(comp)
+        # goal_grid is fixed, so the grid only changes when the
+        # predictor weights do; reuse the last spread otherwise
+        if self.comp_grid_version != self.predict.version:
+            self.comp_grid_cache = self.predict.spread(self.goal_grid)
+            self.comp_grid_version = self.predict.version
+        return self.comp_grid_cache
+        #return SMController.comp_fun(self.comp_grid_cache)
 
     def spread(self, inps):
 
@@ -257,7 +265,7 @@ class SMController:
             mch_idcs &= self.episode_mask
 
             # compute number of chosen patterns (return)
-            n_items = sum(mch_idcs)
+            n_items = np.count_nonzero(mch_idcs)
             idcs = mch_idcs
 
             modulate = cgoals[idcs] * matches[idcs]
@@ -271,12 +279,11 @@ class SMController:
                              self.stm_p.update(proprios[idcs], modulate).item(),
                              self.stm_a.update(policies[idcs], modulate).item())
 
-            # find max match_value within each episode
+            # find max match_value within each episode; flat indices
+            # straight from argmax, no (stime, stime) one-hot matrix
             stime = params.stime
             m = matches.reshape(-1, stime)
-            m = np.eye(stime)[np.argmax(m, 1)]
-            m = m.reshape(-1)
-            idcs = np.where(m == 1)
+            idcs = np.argmax(m, axis=1) + np.arange(m.shape[0]) * stime
 
             # update maxmatch
             cmm = matches[idcs].max()
@@ -299,8 +306,8 @@ class SMController:
                     "policies": [],
                 }
 
-            mch_idcs = np.ones_like(matches.ravel()) > 0
-            n_items = sum(1 * mch_idcs)
+            mch_idcs = np.ones(matches.size, dtype=bool)
+            n_items = matches.size
 
             if self.count < params.pretest_epochs:
 
@@ -14,6 +14,7 @@ import params
 from SMController import SMController
 from SMEnv import SMEnv
 from SMAgent import SMAgent
+from SMVecEnv import PoolVecEnv
 from box2dsim.envs.Simulator import TestPlotterVisualSalience
 
 from SMGraphs import (
@@ -31,6 +32,8 @@ import matplotlib.pyplot as plt
 
 np.set_printoptions(formatter={"float": "{:6.4f}".format})
 
+DTYPE = params.buffer_dtype
+
 storage_dir = "storage"
 site_dir = "www"
 simulations_dir = "simulations"
@@ -46,6 +49,9 @@ class SensoryMotorCicle:
         self.t = 0
         self.action_steps = action_steps
 
+    def reset(self):
+        self.t = 0
+
     def step(self, env, agent, state):
         if self.t % self.action_steps == 0:
             self.action = agent.step(state)
@@ -58,7 +64,9 @@ def modulate_param(base, limit, prop):
     return base + (limit - base) * prop
 
 def softmax(x, t=0.01):
-    e = np.exp(x / t)
+    # subtracting the max keeps the exponentials from overflowing
+    # without changing the result
+    e = np.exp((x - np.max(x)) / t)
     return e / (e.sum() + 1e-100)
 
 
@@ -78,6 +86,7 @@ class Main:
         if self.plots is True:
             remove_figs()
 
+        self.init_taskspace_bounds()
         self.env = SMEnv(seed, params.action_steps)
         self.agent = SMAgent(self.env)
         self.controller = SMController(
@@ -108,6 +117,7 @@ class Main:
         torch.manual_seed(self.seed)
         self.rng = np.random.RandomState()
         self.rng.__setstate__(state["rng"])
+        self.init_taskspace_bounds()
 
         nlogs = len(self.logs)
         if params.epochs > nlogs:
@@ -131,11 +141,93 @@ class Main:
         if self.plots is True:
             remove_figs(self.epoch)
 
-    def is_object_out_of_taskspace(self, state):
-        obj_xy = state["OBJ_POSITION"][0, 0]
+    def save_checkpoint(self, path):
+        """Serializes the simulation state to a compressed npz archive.
+
+        Only the map/predictor weights, the RNG states and the training
+        progress are stored, instead of pickling the whole object graph
+        as before.
+        """
+        cstate = self.controller.__getstate__()
+        main_rng = self.rng.get_state()
+        env_rng = self.env.b2d_env.rng.get_state()
+        maxmatch = cstate["maxmatch"]
+        np.savez_compressed(
+            path,
+            visual=cstate["visual"],
+            ssensory=cstate["ssensory"],
+            proprio=cstate["proprio"],
+            policy=cstate["policy"],
+            predict=cstate["predict"],
+            maxmatch=np.nan if maxmatch is None else maxmatch,
+            main_rng_key=main_rng[1],
+            main_rng_pos=main_rng[2],
+            main_rng_has_gauss=main_rng[3],
+            main_rng_cached=main_rng[4],
+            env_rng_key=env_rng[1],
+            env_rng_pos=env_rng[2],
+            env_rng_has_gauss=env_rng[3],
+            env_rng_cached=env_rng[4],
+            seed=self.seed,
+            plots=self.plots,
+            logs=self.logs,
+            epoch=self.epoch,
+        )
+
+    @classmethod
+    def load_checkpoint(cls, path):
+        data = np.load(path)
+
+        def rng_state(prefix):
+            return ("MT19937",
+                    data[f"{prefix}_key"],
+                    int(data[f"{prefix}_pos"]),
+                    int(data[f"{prefix}_has_gauss"]),
+                    float(data[f"{prefix}_cached"]))
+
+        controller_rng = np.random.RandomState()
+        controller_rng.set_state(rng_state("main_rng"))
+        env_rng = np.random.RandomState()
+        env_rng.set_state(rng_state("env_rng"))
+        maxmatch = float(data["maxmatch"])
+
+        state = {
+            "controller": {
+                "visual": data["visual"],
+                "ssensory": data["ssensory"],
+                "proprio": data["proprio"],
+                "policy": data["policy"],
+                "predict": data["predict"],
+                "rng": controller_rng,
+                "maxmatch": None if np.isnan(maxmatch) else maxmatch,
+            },
+            "env": {"rng": env_rng},
+            "rng": rng_state("main_rng"),
+            "seed": int(data["seed"]),
+            "plots": bool(data["plots"]),
+            "logs": data["logs"],
+            "epoch": int(data["epoch"]),
+        }
+
+        main = cls.__new__(cls)
+        main.__setstate__(state)
+        return main
+
+    def init_taskspace_bounds(self):
         xlim, ylim = params.task_space["xlim"], params.task_space["ylim"]
-        return (obj_xy[0] < xlim[0] or obj_xy[0] > xlim[1]
-                or obj_xy[1] < ylim[0] or obj_xy[1] > ylim[1])
+        self.taskspace_lo = np.array([xlim[0], ylim[0]])
+        self.taskspace_hi = np.array([xlim[1], ylim[1]])
+
+    def is_object_out_of_taskspace(self, state):
+        return self.is_object_out_of_taskspace_batch(
+            state["OBJ_POSITION"][0, 0]
+        )
+
+    def is_object_out_of_taskspace_batch(self, obj_xy):
+        return np.any(
+            (obj_xy < self.taskspace_lo) | (obj_xy > self.taskspace_hi),
+            axis=-1,
+        )
 
     def train(self, time_limits):
 
@@ -152,35 +244,47 @@ class Main:
         epoch = self.epoch
         epoch_start = time.perf_counter()
         contexts = (np.arange(params.batch_size) % 3) + 1
-
-        batch_v = np.zeros([params.batch_size, params.stime, params.visual_size])
-        batch_ss = np.zeros([params.batch_size, params.stime, params.somatosensory_size])
-        batch_p = np.zeros([params.batch_size, params.stime, params.proprioception_size])
-        batch_a = np.zeros([params.batch_size, params.stime, params.policy_size])
-        batch_c = np.ones([params.batch_size, params.stime, 1])
-        batch_log = np.ones([params.batch_size, params.stime, 1])
-        batch_g = np.zeros([params.batch_size, params.stime, params.internal_size])
-        v_r = np.zeros([params.batch_size, params.stime, params.internal_size])
-        ss_r = np.zeros([params.batch_size, params.stime, params.internal_size])
-        p_r = np.zeros([params.batch_size, params.stime, params.internal_size])
-        a_r = np.zeros([params.batch_size, params.stime, params.internal_size])
-        v_p = np.zeros([params.batch_size, params.stime, 2])
-        ss_p = np.zeros([params.batch_size, params.stime, 2])
-        p_p = np.zeros([params.batch_size, params.stime, 2])
-        a_p = np.zeros([params.batch_size, params.stime, 2])
-        g_p = np.zeros([params.batch_size, params.stime, 2])
-
-        match_value = np.zeros([params.batch_size, params.stime])
-        match_value_per_mod = np.zeros([params.batch_size, params.stime, 4])
-        match_increment = np.zeros([params.batch_size, params.stime])
-        match_increment_per_mod = np.zeros([params.batch_size, params.stime, 4])
+        # context of each row of the flattened (batch * stime) buffers
+        context_per_step = np.repeat(contexts, params.stime)
+
+        batch_v = np.zeros([params.batch_size, params.stime, params.visual_size], dtype=DTYPE)
+        batch_ss = np.zeros([params.batch_size, params.stime, params.somatosensory_size], dtype=DTYPE)
+        batch_p = np.zeros([params.batch_size, params.stime, params.proprioception_size], dtype=DTYPE)
+        # the initial spread reads the t=0 slices of the policy and goal
+        # buffers before the epoch broadcast fills them, so those two
+        # must start zeroed; the competence buffers are write-before-read
+        batch_a = np.zeros([params.batch_size, params.stime, params.policy_size], dtype=DTYPE)
+        batch_c = np.empty([params.batch_size, params.stime, 1], dtype=DTYPE)
+        batch_log = np.empty([params.batch_size, params.stime, 1], dtype=DTYPE)
+        batch_g = np.zeros([params.batch_size, params.stime, params.internal_size], dtype=DTYPE)
+        # the per-modality representation and projection-point buffers
+        # live in two stacked tensors (one allocation each); the named
+        # views below keep the original per-modality accessors
+        reps = np.zeros([4, params.batch_size, params.stime, params.internal_size], dtype=DTYPE)
+        v_r, ss_r, p_r, a_r = reps
+        points = np.zeros([5, params.batch_size, params.stime, 2], dtype=DTYPE)
+        v_p, ss_p, p_p, a_p, g_p = points
+
+        # the match values are written window by window (or zeroed when
+        # the loop exits early), the increments keep their zeroed first
+        # window
+        match_value = np.empty([params.batch_size, params.stime], dtype=DTYPE)
+        match_value_per_mod = np.empty([params.batch_size, params.stime, 4], dtype=DTYPE)
+        match_increment = np.zeros([params.batch_size, params.stime], dtype=DTYPE)
+        match_increment_per_mod = np.zeros([params.batch_size, params.stime, 4], dtype=DTYPE)
+
+        vec_env = PoolVecEnv(
+            params.batch_size, self.seed, params.action_steps
+        )
+        timed_out = False
 
         while epoch < params.epochs:
 
             total_time_elapsed = time.perf_counter() - self.start
             if total_time_elapsed >= time_limits:
                 if self.epoch > 0:
-                    raise TimeLimitsException
+                    timed_out = True
+                    break
 
             print(f"{epoch:6d}", end=" ", flush=True)
 
@@ -215,18 +319,10 @@ class Main:
             print(f"{controller.curr_sigma}, {controller.curr_lr}")
 
             # ----- prepare episodes
-            envs = []
-            states = []
-            for episode in range(params.batch_size):
-                # Each environment should have a different seed
-                env = SMEnv(self.seed + episode, params.action_steps)
-                env.b2d_env.prepare_world(contexts[episode])
-                state = env.reset(contexts[episode])
-                batch_v[episode, 0, :] = state["VISUAL_SENSORS"].ravel()
-                batch_ss[episode, 0, :] = state["TOUCH_SENSORS"]
-                batch_p[episode, 0, :] = state["JOINT_POSITIONS"][:5]
-                states.append(state)
-                envs.append(env)
+            obs_v, obs_ss, obs_p = vec_env.reset(contexts)
+            batch_v[:, 0, :] = obs_v
+            batch_ss[:, 0, :] = obs_ss
+            batch_p[:, 0, :] = obs_p
 
             # get Representations for initial states
             Rs, Rp = controller.spread(
@@ -255,37 +351,47 @@ class Main:
             batch_log[::] = rcompetences[:, None, :]
 
             cum_match_increment = np.zeros(params.batch_size)
+            mod_weights = np.asarray(params.modalities_weights, dtype=DTYPE)
+            mod_weights = mod_weights / mod_weights.sum()
+
+            # give each worker the policy of its episodes
+            vec_env.set_policies(batch_a[:, 0, :])
+
+            # hot-loop locals: avoid repeated module/attribute lookups
+            # inside the per-step bookkeeping
+            stime = params.stime
+            action_steps = params.action_steps
+            cum_match_stop_th = params.cum_match_stop_th
+            match_incr_th = params.match_incr_th
+            match_th = params.match_th
+            drop_first_n_steps = params.drop_first_n_steps
+            obs_v, obs_ss, obs_p = vec_env.obs_v, vec_env.obs_ss, vec_env.obs_p
+            obs_obj = vec_env.obs_obj
+            bsize = params.batch_size * action_steps
+            wshape = (params.batch_size, action_steps, -1)
 
             # Main loop through time steps and episodes
-            smcycle = SensoryMotorCicle(params.action_steps)
-            for t in range(1, params.stime+1):
-                if t < params.stime:
-                    for episode in range(params.batch_size):
-                        # Do not update the episode if it has ended
-                        # TEST: Hard stop condition not modulated by competence
-                        if states[episode] is None or cum_match_increment[episode] > params.cum_match_stop_th:
-                            continue
-                        #if states[episode] is None or cum_match_increment[episode] > params.cum_match_stop_th * competences[episode]:
-                        #    continue
-
-
-                        # set correct policy
-                        agent.updatePolicy(batch_a[episode, 0, :])
-                        state = smcycle.step(envs[episode], agent, states[episode])
-
-                        # End the episode if object moves too far away
-                        if self.is_object_out_of_taskspace(state):
-                            states[episode] = None
-                        else:
-                            states[episode] = state
-                            batch_v[episode, t, :] = state["VISUAL_SENSORS"].ravel()
-                            batch_ss[episode, t, :] = state["TOUCH_SENSORS"]
-                            batch_p[episode, t, :] = state["JOINT_POSITIONS"][:5]
-
-                if t % params.action_steps == 0 or t == params.stime:
+            active = np.ones(params.batch_size, dtype=bool)
+            for t in range(1, stime+1):
+                if t < stime:
+                    # Do not update an episode if it has ended
+                    # TEST: Hard stop condition not modulated by competence
+                    active &= cum_match_increment <= cum_match_stop_th
+                    #active &= cum_match_increment <= cum_match_stop_th * competences.ravel()
+
+                    if active.any():
+                        vec_env.step(active)
+
+                        # End episodes whose object moved too far away
+                        active &= ~self.is_object_out_of_taskspace_batch(obs_obj)
+
+                        batch_v[active, t, :] = obs_v[active]
+                        batch_ss[active, t, :] = obs_ss[active]
+                        batch_p[active, t, :] = obs_p[active]
+
+                if t % action_steps == 0 or t == stime:
                     # get Representations for the last N = params.action_steps steps
-                    t0 = t - params.action_steps
-                    bsize = params.batch_size * params.action_steps
+                    t0 = t - action_steps
                     sa = np.s_[:, t0:t, :]
                     Rs, Rp = controller.spread(
                         [
@@ -295,27 +401,54 @@ class Main:
                             batch_a[sa].reshape((bsize, -1)),
                             batch_g[sa].reshape((bsize, -1)),
                         ])
-                    v_r[sa].flat = Rs[0].flat
-                    ss_r[sa].flat = Rs[1].flat
-                    p_r[sa].flat = Rs[2].flat
-                    a_r[sa].flat = Rs[3].flat
-
-                    v_p[sa].flat = Rp[0].flat
-                    ss_p[sa].flat = Rp[1].flat
-                    p_p[sa].flat = Rp[2].flat
-                    a_p[sa].flat = Rp[3].flat
-                    g_p[sa].flat = Rp[4].flat
-
-                    # calculate match value
+                    # single block copy per buffer instead of a python-level
+                    # element-wise copy through the flat iterator
+                    v_r[sa] = Rs[0].reshape(wshape)
+                    ss_r[sa] = Rs[1].reshape(wshape)
+                    p_r[sa] = Rs[2].reshape(wshape)
+                    a_r[sa] = Rs[3].reshape(wshape)
+
+                    v_p[sa] = Rp[0].reshape(wshape)
+                    ss_p[sa] = Rp[1].reshape(wshape)
+                    p_p[sa] = Rp[2].reshape(wshape)
+                    a_p[sa] = Rp[3].reshape(wshape)
+                    g_p[sa] = Rp[4].reshape(wshape)
+
+                    # calculate match value (the sensory modalities are
+                    # passed as one stacked window view, no per-window
+                    # np.stack copy)
                     match_value[:, t0:t], match_value_per_mod[sa] =\
-                        controller.computeMatchSimple(v_p[sa], ss_p[sa], p_p[sa], a_p[sa], g_p[sa])
-                    if t > params.action_steps:
-                        match_increment_per_mod[sa] = np.maximum(0, match_value_per_mod[sa] - match_value_per_mod[:, (t0-1):(t-1), :])
-                        match_increment[:, t0:t] = np.average(match_increment_per_mod[sa], axis=-1, weights=params.modalities_weights)
+                        controller.computeMatchStacked(points[:4, :, t0:t, :], g_p[sa])
+                    if t > action_steps:
+                        # in-place ufuncs on the window views avoid
+                        # allocating temporaries every action_steps steps
+                        incr = match_increment_per_mod[sa]
+                        np.subtract(match_value_per_mod[sa],
+                                    match_value_per_mod[:, (t0-1):(t-1), :],
+                                    out=incr)
+                        np.maximum(incr, 0, out=incr)
+                        match_increment[:, t0:t] = incr @ mod_weights
                         # update cumulative match
-                        if t0 > params.drop_first_n_steps:
-                            cum_match_increment += ((match_increment[:, t0:t] > params.match_incr_th) &
-                                                    (match_value[:, t0:t] > params.match_th)).sum(axis=-1)
+                        if t0 > drop_first_n_steps:
+                            mmask = match_increment[:, t0:t] > match_incr_th
+                            mmask &= match_value[:, t0:t] > match_th
+                            cum_match_increment += mmask.sum(axis=-1)
+
+                    # Once every episode has finished, the remaining
+                    # windows would only spread zero observations: skip
+                    # them and keep their match values at zero so the
+                    # controller update cannot select those rows.  The
+                    # representation and point buffers are only cleared
+                    # here, so their skipped tails must be zeroed too or
+                    # the diagnose dumps would mix in the previous epoch.
+                    if t < stime and not active.any():
+                        match_value[:, t:].fill(0)
+                        match_value_per_mod[:, t:, :].fill(0)
+                        match_increment[:, t:].fill(0)
+                        match_increment_per_mod[:, t:, :].fill(0)
+                        reps[:, :, t:, :].fill(0)
+                        points[:, :, t:, :].fill(0)
+                        break
 
             # ---- end of an epoch: controller update
             bsize = params.batch_size * params.stime
@@ -335,8 +468,9 @@ class Main:
 
             # ---- print
 
-            c = np.outer(contexts, np.ones(params.stime)).ravel()
-            items = [np.sum(update_episodes[c == k]) for k in range(1, 4)]
+            items = np.bincount(
+                context_per_step, weights=update_episodes, minlength=4
+            )[1:4].astype(int)
             items = "".join(
                 list(
                     map(
@@ -399,37 +533,37 @@ class Main:
 
                 epoch_dir = f"{storage_dir}/{epoch:06d}"
                 os.makedirs(epoch_dir, exist_ok=True)
-                np.save(f"{epoch_dir}/main.dump", [self], allow_pickle=True)
+                self.save_checkpoint(f"{epoch_dir}/main.dump.npz")
                 self.diagnose()
 
                 time_elapsed = time.perf_counter() - epoch_start
                 print("---- TIME: %10.4f" % time_elapsed, flush=True)
                 epoch_start = time.perf_counter()
 
-            match_value[::] = 0
-            match_increment[::] = 0
-            match_value_per_mod[::] = 0
-            match_increment_per_mod[::] = 0
-            batch_v[::] = 0
-            batch_ss[::] = 0
-            batch_p[::] = 0
-            batch_a[::] = 0
-            v_r[::] = 0
-            ss_r[::] = 0
-            p_r[::] = 0
-            a_r[::] = 0
-            v_p[::] = 0
-            ss_p[::] = 0
-            p_p[::] = 0
-            a_p[::] = 0
+            # Only the sparsely written buffers need a clean slate for the
+            # next epoch: observation rows of finished episodes must read
+            # as zeros. Everything else (policies, representations, points
+            # and match values) is fully overwritten within an epoch.
+            # fill(0) is a plain memset per buffer.
+            batch_v.fill(0)
+            batch_ss.fill(0)
+            batch_p.fill(0)
+            # the first action_steps window of the increments is never
+            # written, so it has to stay zero as well
+            match_increment[:, :params.action_steps].fill(0)
+            match_increment_per_mod[:, :params.action_steps].fill(0)
 
             epoch += 1
             self.epoch = epoch
             sys.stdout.flush()
 
+        vec_env.close()
+        if timed_out:
+            raise TimeLimitsException
+
     def diagnose(self):
 
-        np.save("main.dump", [self], allow_pickle=True)
+        self.save_checkpoint("main.dump.npz")
 
         env = self.env
         agent = self.agent
@@ -472,6 +606,7 @@ class Main:
         if os.path.isfile("PLOT_SIMS"):
             print("----> Test Sims ...", end=" ", flush=True)
 
+            smcycle = SensoryMotorCicle()
             for k in range(params.tests):
 
                 context = (k // (params.tests//3)) + 1
@@ -499,21 +634,23 @@ class Main:
                 )
                 agent.updatePolicy(policy)
 
-                batch_v = np.zeros([params.stime, params.visual_size])
+                batch_v = np.zeros([params.stime, params.visual_size], dtype=DTYPE)
                 batch_ss = np.zeros(
                     [
                         params.stime,
                         params.somatosensory_size,
-                    ]
+                    ],
+                    dtype=DTYPE,
                 )
                 batch_p = np.zeros(
                     [
                         params.stime,
                         params.proprioception_size,
-                    ]
+                    ],
+                    dtype=DTYPE,
                 )
-                batch_a = np.zeros([params.stime, params.policy_size])
-                batch_g = np.zeros([params.stime, params.internal_size])
+                batch_a = np.zeros([params.stime, params.policy_size], dtype=DTYPE)
+                batch_g = np.zeros([params.stime, params.internal_size], dtype=DTYPE)
 
                 batch_v[0] = v
                 batch_ss[0] = ss
@@ -521,7 +658,7 @@ class Main:
                 batch_a[0] = policy.reshape(-1)
                 batch_g[0] = internal_mean.reshape(-1)
 
-                smcycle = SensoryMotorCicle()
+                smcycle.reset()
                 for t in range(params.stime):
                     state = smcycle.step(env, agent, state)
 
@@ -551,17 +688,22 @@ class Main:
                 match_increment = np.zeros(params.stime)
                 match_increment[1:] = np.average(match_increment_per_mod, axis=-1, weights=params.modalities_weights)
 
-                matches = ((match_increment > params.match_incr_th)
-                           & (match_value > params.match_th))
-                matches[:params.drop_first_n_steps] = 0
+                matches = match_increment > params.match_incr_th
+                matches &= match_value > params.match_th
+                matches[:params.drop_first_n_steps] = False
                 cum_match = np.cumsum(matches)
 
-                #non_zero = (cum_match > competence[0] * params.cum_match_stop_th).nonzero()[0]
+                # cum_match is nondecreasing, so the first step over the
+                # threshold can be binary-searched instead of scanning a
+                # full boolean mask
+                #stop = np.searchsorted(cum_match, competence[0] * params.cum_match_stop_th, side="right")
                 # TEST: Hard stop threshold not modulated by competence
-                non_zero = (cum_match > params.cum_match_stop_th).nonzero()[0]
-                if len(non_zero) > 0:
-                    match_value = match_value[:non_zero[0]]
-                    matches = matches[:non_zero[0]]
+                stop = np.searchsorted(
+                    cum_match, params.cum_match_stop_th, side="right"
+                )
+                if stop < len(cum_match):
+                    match_value = match_value[:stop]
+                    matches = matches[:stop]
 
                 env.render_info(
                     match_value,
@@ -584,23 +726,23 @@ class Main:
                 flush=True,
             )
             context = 4  # no object
-            trj = np.zeros([params.internal_size, params.stime, 2])
+            trj = np.zeros([params.internal_size, params.stime, 2], dtype=DTYPE)
 
-            state = env.reset(context)
-            agent.reset()
-            for i, goal_r in enumerate(controller.goal_grid):
-                policy = controller.getPoliciesFromRepresentations(np.array([goal_r]))
-                agent.updatePolicy(policy)
-                smcycle = SensoryMotorCicle()
-                for t in range(params.stime):
-                    state = smcycle.step(env, agent, state)
-                    trj[i, t] = state["JOINT_POSITIONS"][-2:]
-                if i % 10 == 0 or i == params.internal_size - 1:
-                    print(
-                        "{:d}% ".format(int(100 * (i / params.internal_size))),
-                        end=" ",
-                        flush=True,
-                    )
+            # run all goals as one batch of parallel episodes instead of
+            # chaining them one by one through a single env
+            policies = controller.getPoliciesFromRepresentations(
+                controller.goal_grid
+            )
+            trj_env = PoolVecEnv(
+                params.internal_size, self.seed, params.action_steps
+            )
+            trj_env.reset(np.full(params.internal_size, context))
+            trj_env.set_policies(policies)
+            all_goals = np.ones(params.internal_size, dtype=bool)
+            for t in range(params.stime):
+                trj_env.step(all_goals)
+                trj[:, t] = trj_env.obs_jp
+            trj_env.close()
             print(flush=True)
             np.save(f"{site_dir}/trajectories", trj)
             np.save(f"{epoch_dir}/trajectories", trj)
@@ -736,7 +878,11 @@ if __name__ == "__main__":
             config=config,
         )
 
-    if os.path.isfile("main.dump.npy"):
+    if os.path.isfile("main.dump.npz"):
+        main = Main.load_checkpoint("main.dump.npz")
+        main.plots = plots
+    elif os.path.isfile("main.dump.npy"):
+        # legacy whole-object pickle checkpoint
         main = np.load("main.dump.npy", allow_pickle="True")[0]
         main.plots = plots
     else:
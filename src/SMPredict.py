@@ -1,6 +1,7 @@
 import numpy as np
 import torch
 import params
+from stm import to_tensor
 
 
 class SMPredict:
@@ -17,13 +18,17 @@ class SMPredict:
         self.loss = torch.nn.MSELoss()
 
         self.t = 0
+        # bumped whenever the weights change, so that callers can cache
+        # predictions over fixed inputs
+        self.version = 0
 
     def update(self, patterns, labels):
         self.optimizer.zero_grad()
-        output = self.model(torch.tensor(patterns).float())
-        loss = self.loss(output, torch.tensor(labels).float())
+        output = self.model(to_tensor(patterns))
+        loss = self.loss(output, to_tensor(labels))
         loss.backward()
         self.optimizer.step()
+        self.version += 1
         return loss
 
     def get_weights(self):
@@ -32,10 +37,11 @@ class SMPredict:
     def set_weights(self, weights):
         with torch.no_grad():
             self.model.weight.copy_(torch.tensor(weights, dtype=torch.float))
+        self.version += 1
 
     def spread(self, inp):
         assert len(inp.shape) == 2
-        comp = self.model(torch.tensor(inp, dtype=torch.float)).detach().cpu().numpy()
+        comp = self.model(to_tensor(inp)).detach().cpu().numpy()
         # Rescale: competence is the fraction of max n_success
         comp = comp / params.cum_match_stop_th
         comp[comp > 1] = 1.0 # Maximum possible value is 1
@@ -0,0 +1,159 @@
+import os
+import multiprocessing as mp
+
+import numpy as np
+
+import params
+
+
+def _worker(remote, parent_remote, buffers, shapes, first, episodes, seed, action_steps):
+    """Worker loop owning a contiguous bucket of episodes.
+
+    Each episode keeps its own env, agent and action-steps counter.
+    Observations are written directly into the shared buffers, so only
+    commands, policies and the done flags travel through the pipe.
+    """
+    parent_remote.close()
+
+    from SMEnv import SMEnv
+    from SMAgent import SMAgent
+
+    obs_v, obs_ss, obs_p, obs_jp, obs_obj = [
+        np.frombuffer(buf, dtype=params.buffer_dtype).reshape(shape)
+        for buf, shape in zip(buffers, shapes)
+    ]
+
+    envs = [None] * episodes
+    agents = [None] * episodes
+    states = [None] * episodes
+    actions = [None] * episodes
+    steps = np.zeros(episodes, dtype=int)
+
+    def write_obs(i, state):
+        row = first + i
+        obs_v[row] = state["VISUAL_SENSORS"].ravel()
+        obs_ss[row] = state["TOUCH_SENSORS"]
+        obs_p[row] = state["JOINT_POSITIONS"][:5]
+        obs_jp[row] = state["JOINT_POSITIONS"][-2:]
+        if len(state["OBJ_POSITION"]) > 0:
+            obs_obj[row] = state["OBJ_POSITION"][0, 0]
+
+    while True:
+        cmd, data = remote.recv()
+
+        if cmd == "reset":
+            contexts = data
+            for i in range(episodes):
+                if envs[i] is None:
+                    # Each environment should have a different seed
+                    envs[i] = SMEnv(seed + first + i, action_steps)
+                    agents[i] = SMAgent(envs[i])
+                else:
+                    # reuse the env: reseeding reproduces the stream a
+                    # freshly constructed one would draw this epoch
+                    envs[i].b2d_env.set_seed(seed + first + i)
+                agents[i].reset()
+                envs[i].b2d_env.prepare_world(contexts[i])
+                states[i] = envs[i].reset(contexts[i])
+                steps[i] = 0
+                write_obs(i, states[i])
+            remote.send(True)
+
+        elif cmd == "set_policies":
+            policies = data
+            for i in range(episodes):
+                agents[i].updatePolicy(policies[i])
+            remote.send(True)
+
+        elif cmd == "step":
+            active = data
+            for i in range(episodes):
+                if not active[i]:
+                    continue
+                if steps[i] % action_steps == 0:
+                    actions[i] = agents[i].step(states[i])
+                states[i] = envs[i].step(actions[i])
+                steps[i] += 1
+                write_obs(i, states[i])
+            remote.send(True)
+
+        elif cmd == "close":
+            remote.close()
+            break
+
+
+class PoolVecEnv:
+    """Steps a batch of SMEnv episodes in parallel across worker processes.
+
+    The batch is bucketed over at most cpu_count workers.  Observations
+    come back as stacked (batch_size, obs_size) arrays backed by shared
+    memory, so stepping the whole batch costs one pipe roundtrip per
+    worker instead of one python-level env.step per episode.
+    """
+
+    def __init__(self, batch_size, seed, action_steps=5, workers=None):
+        if workers is None:
+            workers = min(batch_size, os.cpu_count() or 1)
+        self.batch_size = batch_size
+
+        ctx = mp.get_context("fork")
+
+        shapes = [
+            (batch_size, params.visual_size),
+            (batch_size, params.somatosensory_size),
+            (batch_size, params.proprioception_size),
+            (batch_size, 2),
+            (batch_size, 2),
+        ]
+        ctype = np.ctypeslib.as_ctypes_type(params.buffer_dtype)
+        buffers = [ctx.RawArray(ctype, int(np.prod(shape))) for shape in shapes]
+        self.obs_v, self.obs_ss, self.obs_p, self.obs_jp, self.obs_obj = [
+            np.frombuffer(buf, dtype=params.buffer_dtype).reshape(shape)
+            for buf, shape in zip(buffers, shapes)
+        ]
+
+        # bucket the episodes over the workers
+        sizes = np.full(workers, batch_size // workers)
+        sizes[: batch_size % workers] += 1
+        firsts = np.concatenate([[0], np.cumsum(sizes)])
+        self.slices = [np.s_[firsts[w]:firsts[w + 1]] for w in range(workers)]
+
+        self.remotes = []
+        self.processes = []
+        for w in range(workers):
+            remote, work_remote = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                args=(work_remote, remote, buffers, shapes,
+                      int(firsts[w]), int(sizes[w]), seed, action_steps),
+                daemon=True,
+            )
+            process.start()
+            work_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+    def reset(self, contexts):
+        for remote, sl in zip(self.remotes, self.slices):
+            remote.send(("reset", contexts[sl]))
+        for remote in self.remotes:
+            remote.recv()
+        return self.obs_v, self.obs_ss, self.obs_p
+
+    def set_policies(self, policies):
+        for remote, sl in zip(self.remotes, self.slices):
+            remote.send(("set_policies", policies[sl]))
+        for remote in self.remotes:
+            remote.recv()
+
+    def step(self, active):
+        for remote, sl in zip(self.remotes, self.slices):
+            remote.send(("step", active[sl]))
+        for remote in self.remotes:
+            remote.recv()
+
+    def close(self):
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
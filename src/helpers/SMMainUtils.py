@@ -106,10 +106,10 @@ class MainUtils(Main):
         controller = self.controller
         
         
-        batch_v = np.zeros([params.stime, params.visual_size])
-        batch_ss = np.zeros([params.stime, params.somatosensory_size])
-        batch_p = np.zeros([params.stime, params.proprioception_size])
-        batch_a = np.zeros([params.stime, params.policy_size])
+        batch_v = np.zeros([params.stime, params.visual_size], dtype=DTYPE)
+        batch_ss = np.zeros([params.stime, params.somatosensory_size], dtype=DTYPE)
+        batch_p = np.zeros([params.stime, params.proprioception_size], dtype=DTYPE)
+        batch_a = np.zeros([params.stime, params.policy_size], dtype=DTYPE)
 
         v_r = np.zeros([params.stime, params.internal_size])
         ss_r = np.zeros([params.stime, params.internal_size])
@@ -272,10 +272,10 @@ class MainUtils(Main):
         controller = self.controller
         
         
-        batch_v = np.zeros([params.stime, params.visual_size])
-        batch_ss = np.zeros([params.stime, params.somatosensory_size])
-        batch_p = np.zeros([params.stime, params.proprioception_size])
-        batch_a = np.zeros([params.stime, params.policy_size])
+        batch_v = np.zeros([params.stime, params.visual_size], dtype=DTYPE)
+        batch_ss = np.zeros([params.stime, params.somatosensory_size], dtype=DTYPE)
+        batch_p = np.zeros([params.stime, params.proprioception_size], dtype=DTYPE)
+        batch_a = np.zeros([params.stime, params.policy_size], dtype=DTYPE)
 
         v_r = np.zeros([params.stime, params.internal_size])
         ss_r = np.zeros([params.stime, params.internal_size])
@@ -307,6 +307,7 @@ class MainUtils(Main):
         regress_rot_data = np.load("regress1_data.npy", allow_pickle=True)[0]
 
         # iterate prototypes
+        smcycle = SensoryMotorCicle()
         for i, goal_p in enumerate(controller.radial_grid):
             goal_r = controller.stm_a.getRepresentation(
                     goal_p, 0.5)
@@ -375,7 +376,7 @@ class MainUtils(Main):
             batch_a[0, :] = policy
 
             # iterate
-            smcycle = SensoryMotorCicle()
+            smcycle.reset()
             poses = np.zeros([params.stime, params.grip_output])
             for t in range(1, params.stime):
                 state = smcycle.step(env, agent, state)
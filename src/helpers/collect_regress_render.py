@@ -64,13 +64,17 @@ if __name__ == "__main__":
             name=args.name
         )
 
-    if os.path.isfile("main.dump.npy"):
-        main_core = np.load(
-            "main.dump.npy", allow_pickle="True"
-        )[0]
-
-        main = MainUtils()
-        main.__dict__.update(main_core.__dict__)
+    if os.path.isfile("main.dump.npz") or os.path.isfile("main.dump.npy"):
+        if os.path.isfile("main.dump.npz"):
+            main = MainUtils.load_checkpoint("main.dump.npz")
+        else:
+            # legacy whole-object pickle checkpoint
+            main_core = np.load(
+                "main.dump.npy", allow_pickle="True"
+            )[0]
+
+            main = MainUtils()
+            main.__dict__.update(main_core.__dict__)
 
         main.collect_sensory_states()
         regress()
@@ -570,12 +570,15 @@ if __name__ == "__main__":
 
     # %%
     data_files = sorted(glob.glob("storage/*/weig*"))
-    main_files = sorted(glob.glob("storage/*/main*npy"))
+    main_files = sorted(glob.glob("storage/*/main*np[yz]"))
     data_epochs = [int(re.sub(".*e/(.*)/w.*", r"\1", f)) for f in data_files]
     store = np.load(data_files[-1], allow_pickle=True)[0]
 
     # %%
-    logs = np.load(main_files[-1], allow_pickle=True)[0].logs
+    if main_files[-1].endswith(".npz"):
+        logs = np.load(main_files[-1])["logs"]
+    else:
+        logs = np.load(main_files[-1], allow_pickle=True)[0].logs
 
     # %%
 
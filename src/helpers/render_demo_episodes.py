@@ -39,7 +39,11 @@ if __name__ == "__main__":
     if not gpu:
         os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
 
-    if os.path.isfile("main.dump.npy"):
+    if os.path.isfile("main.dump.npz"):
+        main = Main.load_checkpoint("main.dump.npz")
+        main.demo_episodes()
+    elif os.path.isfile("main.dump.npy"):
+        # legacy whole-object pickle checkpoint
         main = np.load(
             "main.dump.npy", allow_pickle="True"
         )[0]
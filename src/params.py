@@ -1,4 +1,7 @@
 import numpy as np
+# dtype of the sensory/motor batch buffers; the torch maps work in
+# float32, keeping the buffers float32 halves the memory traffic
+buffer_dtype = np.float32
 task_space = {"xlim": [-10, 50], "ylim": [-10, 50]}
 stime = 200
 drop_first_n_steps = 20
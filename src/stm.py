@@ -10,6 +10,21 @@ Generalizes SOMs.
 import numpy as np
 import torch
 
+def to_tensor(x):
+    """Stages an array as a float32 tensor on the default device.
+
+    Float32 numpy inputs are wrapped without copying; other dtypes cost
+    a single conversion copy instead of the elementwise copy of
+    torch.tensor.
+    """
+    if isinstance(x, torch.Tensor):
+        return x.float()
+    x = torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32))
+    device = torch.empty(0).device
+    if device.type != "cpu":
+        x = x.to(device)
+    return x
+
 def is_2d(func):
     func.type = "2d"
     return func
@@ -174,13 +189,13 @@ class SMSTM(STM):
         self.optimizer = torch.optim.Adam(self.parameters(), lr=learning_rate)
 
     def spread(self, x):
-        return super(SMSTM, self).spread(torch.tensor(x, dtype=torch.float)).cpu().detach().numpy()
+        return super(SMSTM, self).spread(to_tensor(x)).cpu().detach().numpy()
 
     def backward(self, x):
-        return super(SMSTM, self).backward(torch.tensor(x, dtype=torch.float)).cpu().detach().numpy()
+        return super(SMSTM, self).backward(to_tensor(x)).cpu().detach().numpy()
 
     def get_point_and_representation(self, out, sigma=None):
-        out = torch.tensor(out, dtype=torch.float)
+        out = to_tensor(out)
 
         if sigma is None:
             sigma = self.sigma
@@ -215,8 +230,8 @@ class SMSTM(STM):
     def update(self, data, dists):
         assert len(data.shape) == 2
         assert data.shape[1] == self.input_size
-        data = torch.tensor(data, dtype=torch.float)
-        dists = torch.tensor(dists, dtype=torch.float)
+        data = to_tensor(data)
+        dists = to_tensor(dists)
         self.optimizer.zero_grad()
         out = self(data)
         loss = self.loss(out, dists)